@@ -1,11 +1,28 @@
 from pathlib import Path
+import functools
 import gspread
+import requests.adapters
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
 from loguru import logger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import queue
+import threading
 import time
 from datetime import datetime
 
+SCOPES = (
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_creds(creds_path: str) -> Credentials:
+    """Parse the service-account file once per path - reconnects reuse the
+    cached Credentials instead of re-reading and re-signing"""
+    return Credentials.from_service_account_file(creds_path, scopes=list(SCOPES))
+
 
 class GoogleSheetsManager:
     def __init__(self, sheet_name: str = "Mackolik Matches"):
@@ -16,6 +33,35 @@ class GoogleSheetsManager:
         self.worksheet = None
         self.last_update = None
         self.batch_size = 100  # Process in batches for better performance
+        # Cached sheet contents - a full get_all_values() is a ~300-1500ms
+        # round-trip, so serve reads from cache until a write dirties it
+        self._values_cache: Optional[List[List[str]]] = None
+        self._cache_dirty = True
+        # Background write batching - rows are queued and flushed in one
+        # append_rows call every few seconds, instead of one HTTP POST per
+        # row (each counts against the 60-writes/min quota)
+        self.flush_interval = 5.0  # seconds
+        self.flush_threshold = 50  # rows
+        self._write_queue = queue.Queue()
+        self._flusher = None
+        self._flusher_stop = threading.Event()
+        self._flush_now = threading.Event()
+
+    def _get_cached_values(self) -> List[List[str]]:
+        """Return sheet values, hitting the API only after a write"""
+        if self._cache_dirty or self._values_cache is None:
+            # Clear the flag before the fetch: the flusher thread may
+            # invalidate mid-GET, and that invalidation must survive
+            self._cache_dirty = False
+            try:
+                self._values_cache = self.worksheet.get_all_values()
+            except Exception:
+                self._cache_dirty = True
+                raise
+        return self._values_cache
+
+    def _invalidate_cache(self):
+        self._cache_dirty = True
 
     def connect(self):
         """Connect to Google Sheets with improved error handling"""
@@ -26,17 +72,20 @@ class GoogleSheetsManager:
             if not self.creds_file.exists():
                 raise FileNotFoundError(f"Credentials file not found: {self.creds_file}")
 
-            # Set up authentication
-            scopes = [
-                "https://www.googleapis.com/auth/spreadsheets",
-                "https://www.googleapis.com/auth/drive"
-            ]
-
-            creds = Credentials.from_service_account_file(
-                str(self.creds_file),
-                scopes=scopes
-            )
-            self.client = gspread.authorize(creds)
+            # Set up authentication - creds are cached per path, and the
+            # client reuses one keep-alive session so successive API calls
+            # share a pooled TLS connection instead of re-handshaking
+            creds = _load_creds(str(self.creds_file))
+            if self.client is None:
+                session = AuthorizedSession(creds)
+                session.headers['Connection'] = 'keep-alive'
+                # Pooled adapter so the API thread and the background
+                # flusher each keep a warm connection instead of
+                # re-handshaking when calls overlap
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=4, pool_maxsize=4)
+                session.mount('https://', adapter)
+                self.client = gspread.Client(auth=creds, session=session)
 
             # Open or create the spreadsheet
             try:
@@ -50,6 +99,11 @@ class GoogleSheetsManager:
             self.worksheet = self.sheet.sheet1
             self.last_update = datetime.now()
 
+            # Start the background flusher once we have a worksheet
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flusher.start()
+
             logger.success(f"✅ Successfully connected to Google Sheets: {self.sheet_name}")
             return True
 
@@ -74,6 +128,7 @@ class GoogleSheetsManager:
             if not existing_headers or existing_headers != headers:
                 # Clear the first row and add headers
                 self.worksheet.insert_row(headers, 1)
+                self._invalidate_cache()
 
                 # Format headers (make them bold)
                 self.worksheet.format('1:1', {
@@ -98,6 +153,7 @@ class GoogleSheetsManager:
                 values.append(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
             self.worksheet.append_row(values)
+            self._invalidate_cache()
             logger.debug(f"📝 Row written: {values[:3]}...")  # Log first 3 values
             return True
 
@@ -105,23 +161,83 @@ class GoogleSheetsManager:
             logger.error(f"❌ Error writing row: {e}")
             return False
 
-    def write_rows_batch(self, rows: List[List[Any]]):
-        """Write multiple rows in batch for better performance"""
+    def queue_row(self, values: List[Any]):
+        """Queue a row for the background flusher instead of writing it now"""
+        self._write_queue.put(values)
+        if self._write_queue.qsize() >= self.flush_threshold:
+            self._flush_now.set()  # Wake the flusher early
+
+    def _drain_queue(self) -> List[List[Any]]:
+        rows = []
+        try:
+            while len(rows) < self.batch_size:
+                rows.append(self._write_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return rows
+
+    def _flush_loop(self):
+        """Daemon thread: flush queued rows every flush_interval seconds,
+        or sooner when flush_threshold rows are pending"""
+        while not self._flusher_stop.is_set():
+            self._flush_now.wait(self.flush_interval)
+            self._flush_now.clear()
+            if self._write_queue.qsize() > 0:
+                self.flush()
+
+    def flush(self):
+        """Write all queued rows in one append_rows call"""
+        while True:
+            rows = self._drain_queue()
+            if not rows:
+                return True
+            try:
+                self.worksheet.append_rows(rows, value_input_option='RAW')
+                self._invalidate_cache()
+                self.last_update = datetime.now()
+                logger.debug(f"📝 Flushed {len(rows)} queued rows")
+            except Exception as e:
+                # Re-queue the drained rows so the next flush retries them -
+                # a transient failure must not silently drop captures
+                for row in rows:
+                    self._write_queue.put(row)
+                logger.error(f"❌ Error flushing queued rows: {e}")
+                return False
+
+    def close(self):
+        """Stop the background flusher and push out any pending rows"""
+        self._flusher_stop.set()
+        self._flush_now.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=self.flush_interval * 2)
+            self._flusher = None
+        return self.flush()
+
+    def write_rows_batch(self, rows):
+        """Write multiple rows in batch for better performance.
+
+        Accepts a list of lists, a numpy array, or a pandas DataFrame -
+        array-likes are converted to plain lists in one C-level pass
+        instead of per-cell Python iteration."""
         if not self.worksheet:
             raise RuntimeError("Google Sheets not connected. Call connect() first.")
 
+        # DataFrame -> ndarray, ndarray -> nested lists, each a single pass
+        if hasattr(rows, 'values') and not isinstance(rows, (list, tuple)):
+            rows = rows.values
+        if hasattr(rows, 'tolist'):
+            rows = rows.tolist()
+
         if not rows:
             return True
 
         try:
-            # Add timestamps to rows that don't have them
-            processed_rows = []
+            # Add timestamps to rows that don't have them (computed once)
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            for row in rows:
-                if len(row) < 10:  # Assuming 10 columns
-                    row = row + [current_time]
-                processed_rows.append(row)
+            processed_rows = [
+                row if len(row) >= 10 else row + [current_time]  # Assuming 10 columns
+                for row in rows
+            ]
 
             # Write in batches to avoid API limits
             for i in range(0, len(processed_rows), self.batch_size):
@@ -135,6 +251,7 @@ class GoogleSheetsManager:
 
             logger.success(f"✅ Successfully wrote {len(processed_rows)} rows to sheet")
             self.last_update = datetime.now()
+            self._invalidate_cache()
             return True
 
         except Exception as e:
@@ -148,6 +265,7 @@ class GoogleSheetsManager:
 
         try:
             self.worksheet.clear()
+            self._invalidate_cache()
             logger.info("🧹 Sheet cleared")
             return True
         except Exception as e:
@@ -174,6 +292,7 @@ class GoogleSheetsManager:
 
         try:
             self.worksheet.update_cell(row, col, value)
+            self._invalidate_cache()
             logger.debug(f"📝 Cell updated: ({row}, {col}) = {value}")
             return True
         except Exception as e:
@@ -186,15 +305,14 @@ class GoogleSheetsManager:
             return []
 
         try:
-            all_values = self.worksheet.get_all_values()
-            duplicate_rows = []
+            all_values = self._get_cached_values()
 
-            for i, row in enumerate(all_values[1:], start=2):  # Skip header row
-                if len(row) > 2 and row[2] == teams:  # Assuming teams are in column 3
-                    if date is None or (len(row) > 1 and row[1] == date):
-                        duplicate_rows.append(i)
-
-            return duplicate_rows
+            # Single comprehension pass - teams in column 3, date in column 2
+            return [
+                i for i, row in enumerate(all_values[1:], start=2)  # Skip header row
+                if len(row) > 2 and row[2] == teams
+                and (date is None or row[1] == date)
+            ]
         except Exception as e:
             logger.error(f"❌ Error finding duplicates: {e}")
             return []
@@ -205,28 +323,53 @@ class GoogleSheetsManager:
             raise RuntimeError("Google Sheets not connected")
 
         try:
-            all_values = self.worksheet.get_all_values()
+            all_values = self._get_cached_values()
             if len(all_values) <= 1:  # Only headers or empty
                 return
 
             seen_matches = set()
-            rows_to_keep = [all_values[0]]  # Keep headers
-            duplicates_removed = 0
+            duplicate_indices = []  # 0-based sheet row indices to delete
 
-            for row in all_values[1:]:
+            for i, row in enumerate(all_values[1:], start=1):  # Skip header row
                 if len(row) > 2:
-                    match_key = f"{row[0]}_{row[1]}_{row[2]}"  # League_Date_Teams
+                    match_key = (row[0], row[1], row[2])  # League, Date, Teams
                     if match_key not in seen_matches:
                         seen_matches.add(match_key)
-                        rows_to_keep.append(row)
                     else:
-                        duplicates_removed += 1
-
-            if duplicates_removed > 0:
-                # Clear and rewrite the sheet
-                self.worksheet.clear()
-                self.worksheet.append_rows(rows_to_keep)
-                logger.info(f"🧹 Removed {duplicates_removed} duplicate matches")
+                        duplicate_indices.append(i)
+
+            if not duplicate_indices:
+                return  # Nothing to delete - skip the write API call entirely
+
+            # Coalesce consecutive indices into (start, end) ranges so one
+            # batchUpdate deletes everything, instead of clear() + rewrite
+            ranges = []
+            start = prev = duplicate_indices[0]
+            for idx in duplicate_indices[1:]:
+                if idx == prev + 1:
+                    prev = idx
+                else:
+                    ranges.append((start, prev + 1))
+                    start = prev = idx
+            ranges.append((start, prev + 1))
+
+            # Delete bottom-up so earlier deletions don't shift later ranges
+            requests = [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": self.worksheet.id,
+                            "dimension": "ROWS",
+                            "startIndex": s,
+                            "endIndex": e
+                        }
+                    }
+                }
+                for (s, e) in reversed(ranges)
+            ]
+            self.sheet.batch_update({"requests": requests})
+            self._invalidate_cache()
+            logger.info(f"🧹 Removed {len(duplicate_indices)} duplicate matches")
 
         except Exception as e:
             logger.error(f"❌ Error removing duplicates: {e}")
@@ -237,7 +380,7 @@ class GoogleSheetsManager:
             return {}
 
         try:
-            all_values = self.worksheet.get_all_values()
+            all_values = self._get_cached_values()
             row_count = len(all_values) - 1 if all_values else 0  # Exclude headers
 
             stats = {